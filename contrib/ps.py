@@ -101,10 +101,10 @@ def print_cpu_tasks(cmd_opts):
     """
     Print running and runnable tasks on a given CPU
     """
+    cpus = set(cmd_opts.cpus) if cmd_opts.cpus else None
     for cpu in for_each_online_cpu(prog):
-        if cmd_opts.cpus:
-            if cpu not in cmd_opts.cpus:
-                continue
+        if cpus is not None and cpu not in cpus:
+            continue
         print_hdr = True
         for task in for_each_task(prog):
             if task_cpu(task) == cpu:
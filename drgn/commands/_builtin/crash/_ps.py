@@ -13,7 +13,7 @@ import argparse
 import collections
 import functools
 import sys
-from typing import AbstractSet, Any, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from drgn import FaultError, Object, Program
 from drgn.commands import (
@@ -29,6 +29,7 @@ from drgn.commands.crash import (
     Cpuspec,
     CrashDrgnCodeBuilder,
     _crash_foreach_subcommand,
+    _format_nanosecond_duration,
     _format_seconds_duration,
     _pid_or_task_or_command,
     _print_task_header,
@@ -38,7 +39,6 @@ from drgn.commands.crash import (
     print_task_header,
 )
 from drgn.helpers.common.format import CellFormat, escape_ascii_string, print_table
-from drgn.helpers.linux.cpumask import for_each_online_cpu
 from drgn.helpers.linux.kthread import task_is_kthread
 from drgn.helpers.linux.list import list_for_each_entry
 from drgn.helpers.linux.mm import (
@@ -52,7 +52,7 @@ from drgn.helpers.linux.pid import for_each_task_in_group
 from drgn.helpers.linux.resource import task_rlimits
 from drgn.helpers.linux.sched import (
     _TASK_STATE_CHAR_TO_STATE,
-    cpu_rq,
+    _for_each_cpu_rq,
     task_cpu,
     task_on_cpu,
     task_state_to_char,
@@ -96,15 +96,6 @@ def _parse_sched_policies(arg: str) -> AbstractSet[int]:
     return policies
 
 
-def _format_nanosecond_duration(nanoseconds: int) -> str:
-    days, nanoseconds = divmod(nanoseconds, 86400_000_000_000)
-    hours, nanoseconds = divmod(nanoseconds, 3600_000_000_000)
-    minutes, nanoseconds = divmod(nanoseconds, 60_000_000_000)
-    seconds, nanoseconds = divmod(nanoseconds, 1_000_000_000)
-    milliseconds = nanoseconds // 1_000_000
-    return f"{days} {hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-
-
 def _ps_parents(task_selector: _TaskSelector, drgn_arg: bool) -> None:
     prog = task_selector.prog
 
@@ -256,12 +247,16 @@ def _ps_last_arrival(
         for task in task_selector.tasks()
     ]
     if elapsed:
+        # Only read the clocks of the CPUs that the selected tasks are on. This
+        # avoids walking cpu_online_mask, and it also handles tasks whose CPU
+        # has since gone offline.
         rq_clocks = {
-            cpu: cpu_rq(prog, cpu).clock.value_() for cpu in for_each_online_cpu(prog)
+            cpu: rq.clock.value_()
+            for cpu, rq in _for_each_cpu_rq(prog, {row[1] for row in rows})
         }
     rows.sort(reverse=True)
 
-    def print_rows(rows: Sequence[Tuple[int, int, str, Object]]) -> None:
+    def print_rows(rows: Iterable[Tuple[int, int, str, Object]]) -> None:
         timestamp_width = None
 
         for last_arrival, cpu, state, task in rows:
@@ -280,6 +275,14 @@ def _ps_last_arrival(
     if cpuspec is None:
         print_rows(rows)
     else:
+        # Group the (already sorted) rows by CPU in one pass rather than
+        # scanning all of them for every CPU.
+        rows_by_cpu: Dict[int, List[Tuple[int, int, str, Object]]] = (
+            collections.defaultdict(list)
+        )
+        for row in rows:
+            rows_by_cpu[row[1]].append(row)
+
         first = True
         for cpu in cpuspec.cpus(prog):
             if first:
@@ -287,7 +290,7 @@ def _ps_last_arrival(
             else:
                 print()
             print(f"CPU: {cpu}")
-            print_rows([row for row in rows if row[1] == cpu])
+            print_rows(rows_by_cpu.get(cpu, ()))
 
 
 def _ps_arguments(task_selector: _TaskSelector, drgn_arg: bool) -> None:
@@ -15,6 +15,7 @@ from drgn.commands.crash import (
     Cpuspec,
     CrashDrgnCodeBuilder,
     _crash_foreach_subcommand,
+    _format_nanosecond_duration,
     _guess_type,
     _parse_type_name_and_member,
     _prefer_object_lookup,
@@ -27,8 +28,8 @@ from drgn.commands.crash import (
 from drgn.helpers.common.format import CellFormat, escape_ascii_string, print_table
 from drgn.helpers.linux.pid import for_each_task_in_group
 from drgn.helpers.linux.sched import (
+    _for_each_cpu_rq,
     cfs_rq_for_each_entity,
-    cpu_rq,
     rq_for_each_rt_task,
     sched_entity_to_task,
     task_group_name,
@@ -61,11 +62,12 @@ curr_clock = curr.sched_info.last_arrival
 
         return code.print()
 
-    for cpu in cpuspec.cpus(prog):
-        rq = cpu_rq(prog, cpu)
-        print(f" CPU {cpu}: {rq.clock.value_():016d}")
+    for cpu, rq in _for_each_cpu_rq(prog, cpuspec.cpus(prog)):
+        rq_clock = rq.clock.value_()
         curr = rq.curr.read_()
-        print(f"        {curr.sched_info.last_arrival.value_():016d}  ", end="")
+        last_arrival = curr.sched_info.last_arrival.value_()
+        print(f" CPU {cpu}: {rq_clock:016d}")
+        print(f"        {last_arrival:016d}  ", end="")
         _print_task_header(curr, cpu=None)
 
 
@@ -77,7 +79,10 @@ def _runq_lag(prog: Program, cpuspec: Cpuspec, drgn_arg: bool) -> None:
             code.append("rq_clock = cpu_rq(cpu).clock\n")
         return code.print()
 
-    timestamps = [(cpu_rq(prog, cpu).clock.value_(), cpu) for cpu in cpuspec.cpus(prog)]
+    timestamps = [
+        (rq.clock.value_(), cpu)
+        for cpu, rq in _for_each_cpu_rq(prog, cpuspec.cpus(prog))
+    ]
     timestamps.sort(reverse=True)
     if not timestamps:
         return
@@ -89,16 +94,6 @@ def _runq_lag(prog: Program, cpuspec: Cpuspec, drgn_arg: bool) -> None:
         print(f"{cpu_str:>{2 + cpu_width}}: {(max_ts - ts) / 1e9:.2f} secs")
 
 
-def _elapsed_str(ns: int) -> str:
-    ms_total = ns // 1000000
-    secs_total, ms = divmod(ms_total, 1000)
-    mins_total, secs = divmod(secs_total, 60)
-    hours_total, mins = divmod(mins_total, 60)
-    days, hours = divmod(hours_total, 24)
-
-    return f"{days} {hours:02}:{mins:02}:{secs:02}.{ms:03}"
-
-
 def _runq_elapsed(prog: Program, cpuspec: Cpuspec, drgn_arg: bool) -> None:
     if drgn_arg:
         code = CrashDrgnCodeBuilder(prog)
@@ -121,13 +116,12 @@ elapsed = rq_clock - curr_clock
     entries = []
     max_cpu_width = 0
     max_elapsed_width = 0
-    for cpu in cpuspec.cpus(prog):
-        rq = cpu_rq(prog, cpu)
+    for cpu, rq in _for_each_cpu_rq(prog, cpuspec.cpus(prog)):
         curr = rq.curr.read_()
         elapsed = max(rq.clock.value_() - curr.sched_info.last_arrival.value_(), 0)
 
         cpu_str = f"CPU {cpu}"
-        elapsed_str = _elapsed_str(elapsed)
+        elapsed_str = _format_nanosecond_duration(elapsed)
         entries.append((cpu_str, elapsed_str, curr))
 
         max_cpu_width = max(max_cpu_width, len(cpu_str))
@@ -218,13 +212,12 @@ else:
     root_tg_addr = prog["root_task_group"].address_
 
     first = True
-    for cpu in cpuspec.cpus(prog):
+    for cpu, rq in _for_each_cpu_rq(prog, cpuspec.cpus(prog)):
         if first:
             first = False
         else:
             print()
 
-        rq = cpu_rq(prog, cpu)
         curr = rq.curr.read_()
 
         print(f"CPU {cpu}")
@@ -296,24 +289,30 @@ task = sched_entity_to_task(se)
 
         return code.print()
 
+    # The printed addresses are at fixed offsets in struct rq, so compute them
+    # arithmetically instead of creating intermediate objects for every CPU.
+    rq_type = prog.type("struct rq")
+    rt_prio_array_offset = offsetof(rq_type, "rt.active")
+    cfs_rb_root_offset = offsetof(rq_type, "cfs.tasks_timeline")
+
     first = True
-    for cpu in cpuspec.cpus(prog):
+    for cpu, rq in _for_each_cpu_rq(prog, cpuspec.cpus(prog)):
         if first:
             first = False
         else:
             print()
 
-        rq = cpu_rq(prog, cpu)
-        print(f"CPU {cpu} RUNQUEUE {rq.value_():x}")
+        rq_addr = rq.value_()
+        print(f"CPU {cpu} RUNQUEUE {rq_addr:x}")
 
         print("  CURRENT: ", end="")
         _print_task_header(rq.curr.read_(), cpu=None)
 
-        print(f"  RT PRIO_ARRAY: {rq.rt.active.address_:x}")
+        print(f"  RT PRIO_ARRAY: {rq_addr + rt_prio_array_offset:x}")
         _print_rq_tasks(rq_for_each_rt_task(rq))
 
         cfs_rq = rq.cfs.address_of_()
-        print(f"  CFS RB_ROOT: {cfs_rq.tasks_timeline.address_:x}")
+        print(f"  CFS RB_ROOT: {rq_addr + cfs_rb_root_offset:x}")
         _print_rq_tasks(
             sched_entity_to_task(se)
             for se, _, is_curr, is_task in cfs_rq_for_each_entity(cfs_rq)
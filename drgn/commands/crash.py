@@ -178,6 +178,15 @@ def _format_seconds_duration(seconds: int) -> str:
         return f"{hours:02}:{minutes:02}:{seconds:02}"
 
 
+def _format_nanosecond_duration(nanoseconds: int) -> str:
+    days, nanoseconds = divmod(nanoseconds, 86400_000_000_000)
+    hours, nanoseconds = divmod(nanoseconds, 3600_000_000_000)
+    minutes, nanoseconds = divmod(nanoseconds, 60_000_000_000)
+    seconds, nanoseconds = divmod(nanoseconds, 1_000_000_000)
+    milliseconds = nanoseconds // 1_000_000
+    return f"{days} {hours:02d}:{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+
+
 def _find_pager(which: Optional[str] = None) -> Optional[str]:
     if which is None or which == "less":
         less = shutil.which("less")
@@ -10,6 +10,7 @@ formatting different things as text.
 """
 
 import collections
+import functools
 import re
 from typing import (
     TYPE_CHECKING,
@@ -94,6 +95,25 @@ def escape_ascii_character(
         return f"\\x{c:02x}"
 
 
+_PRINTABLE_ASCII_RE = re.compile(rb"[\x20-\x7e]*")
+
+
+# Most strings we escape (e.g., task names) are plain printable ASCII. Checking
+# for that with a regular expression is much faster than escaping byte by byte.
+def _needs_no_escape(
+    buffer: Union[bytes, bytearray],
+    escape_single_quote: bool,
+    escape_double_quote: bool,
+    escape_backslash: bool,
+) -> bool:
+    return (
+        _PRINTABLE_ASCII_RE.fullmatch(buffer) is not None
+        and not (escape_single_quote and b"'" in buffer)
+        and not (escape_double_quote and b'"' in buffer)
+        and not (escape_backslash and b"\\" in buffer)
+    )
+
+
 def escape_ascii_string(
     buffer: Iterable[int],
     escape_single_quote: bool = False,
@@ -106,6 +126,10 @@ def escape_ascii_string(
 
     :param buffer: Byte array to escape.
     """
+    if isinstance(buffer, (bytes, bytearray)) and _needs_no_escape(
+        buffer, escape_single_quote, escape_double_quote, escape_backslash
+    ):
+        return buffer.decode("ascii")
     return "".join(
         escape_ascii_character(
             c,
@@ -128,6 +152,10 @@ def double_quote_ascii_string(buffer: Iterable[int]) -> str:
 
         '"' + escape_ascii_string(buffer, escape_double_quote=True, escape_backslash=True) + '"'
     """
+    if isinstance(buffer, (bytes, bytearray)) and _needs_no_escape(
+        buffer, False, True, True
+    ):
+        return f'"{buffer.decode("ascii")}"'
     parts = [
         escape_ascii_character(c, escape_double_quote=True, escape_backslash=True)
         for c in buffer
@@ -387,6 +415,8 @@ def print_table(
 
 
 class CellFormat:
+    __slots__ = ("_value", "_options", "_rest")
+
     _FORMAT_SPEC_RE = re.compile(
         r"""
         (?P<options>
@@ -419,13 +449,19 @@ class CellFormat:
             not specify a width.
         """
         self._value = value
-        match = self._FORMAT_SPEC_RE.fullmatch(format_spec)
+        self._options, self._rest = self._parse_format_spec(format_spec)
+
+    # Tables typically use a handful of format specs for many cells, so only
+    # parse each one once.
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _parse_format_spec(cls, format_spec: str) -> Tuple[str, str]:
+        match = cls._FORMAT_SPEC_RE.fullmatch(format_spec)
         if not match:
             raise ValueError(f"invalid format_spec {format_spec!r}")
         if match.group("width"):
             raise ValueError("format_spec must not have width")
-        self._options = match.group("options")
-        self._rest = match.group("rest")
+        return match.group("options"), match.group("rest")
 
     def __str__(self) -> str:
         return f"{self._value:{self._options}{self._rest}}"
@@ -10,7 +10,7 @@ The ``drgn.helpers.linux.sched`` module provides helpers for working with the
 Linux CPU scheduler.
 """
 
-from typing import Iterator, Tuple
+from typing import Iterable, Iterator, Tuple
 
 from _drgn import (
     _linux_helper_cpu_curr,
@@ -21,9 +21,10 @@ from _drgn import (
 )
 from drgn import IntegerLike, Object, Program, container_of
 from drgn.helpers.common.prog import takes_program_or_default
+from drgn.helpers.linux.bitops import for_each_set_bit
 from drgn.helpers.linux.cgroup import cgroup_name
 from drgn.helpers.linux.list import list_for_each_entry
-from drgn.helpers.linux.percpu import per_cpu
+from drgn.helpers.linux.percpu import per_cpu_ptr
 from drgn.helpers.linux.rbtree import rbtree_inorder_for_each_entry
 
 __all__ = (
@@ -188,7 +189,36 @@ def cpu_rq(prog: Program, cpu: IntegerLike) -> Object:
     :param cpu: CPU number.
     :returns: ``struct rq *``
     """
-    return per_cpu(prog["runqueues"], cpu).address_of_()
+    return per_cpu_ptr(prog["runqueues"].address_of_(), cpu)
+
+
+def _for_each_cpu_rq(
+    prog: Program, cpus: Iterable[int]
+) -> Iterator[Tuple[int, Object]]:
+    # Equivalent to ((cpu, cpu_rq(prog, cpu)) for cpu in cpus), but runqueues
+    # is looked up and __per_cpu_offset is read once per program instead of
+    # once per CPU. __per_cpu_offset is only set during boot, so it is safe to
+    # cache.
+    try:
+        runqueues, per_cpu_offset = prog.cache["for_each_cpu_rq"]
+    except KeyError:
+        runqueues = prog["runqueues"].address_of_()
+        try:
+            per_cpu_offset = prog["__per_cpu_offset"].read_()
+        except KeyError:
+            # __per_cpu_offset doesn't exist on !SMP kernels.
+            per_cpu_offset = None
+        prog.cache["for_each_cpu_rq"] = runqueues, per_cpu_offset
+
+    if per_cpu_offset is None:
+        for cpu in cpus:
+            yield cpu, runqueues
+        return
+
+    rq_type = runqueues.type_
+    address = runqueues.value_()
+    for cpu in cpus:
+        yield cpu, Object(prog, rq_type, address + per_cpu_offset[cpu].value_())
 
 
 def task_rq(task: Object) -> Object:
@@ -229,13 +259,35 @@ def rq_for_each_rt_task(rq: Object) -> Iterator[Object]:
     """
     Iterate over tasks on a runqueue in the realtime scheduling class.
 
+    This includes tasks queued in child realtime task groups (if the kernel
+    was compiled with ``CONFIG_RT_GROUP_SCHED``).
+
     :param rq: ``struct rq *``
     :return: Iterator of ``struct task_struct *`` objects
     """
-    for queue in rq.rt.active.queue:
-        yield from list_for_each_entry(
-            "struct task_struct", queue.address_of_(), "rt.run_list"
-        )
+    return _rt_rq_for_each_task(rq.rt.address_of_())
+
+
+def _rt_rq_for_each_task(rt_rq: Object) -> Iterator[Object]:
+    active = rt_rq.active
+    queue = active.queue
+    # The bitmap has a bit set for each non-empty priority queue (plus a
+    # delimiter bit after the last one), so we only need to walk those instead
+    # of checking every list head.
+    for prio in for_each_set_bit(active.bitmap.read_(), len(queue)):
+        for rt_se in list_for_each_entry(
+            "struct sched_rt_entity", queue[prio].address_of_(), "run_list"
+        ):
+            # If CONFIG_RT_GROUP_SCHED=y, the entity may be a task group with
+            # its own runqueue rather than a task.
+            try:
+                my_q = rt_se.my_q.read_()
+            except AttributeError:
+                my_q = None
+            if my_q:
+                yield from _rt_rq_for_each_task(my_q)
+            else:
+                yield container_of(rt_se, "struct task_struct", "rt")
 
 
 def sched_entity_is_task(se: Object) -> bool:
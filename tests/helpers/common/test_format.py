@@ -9,6 +9,8 @@ from drgn.helpers.common.format import (
     RowOptions,
     decode_enum_type_flags,
     decode_flags,
+    double_quote_ascii_string,
+    escape_ascii_string,
     number_in_binary_units,
     print_table,
 )
@@ -102,6 +104,36 @@ class TestDecodeFlags(TestCase):
         )
 
 
+class TestEscapeAsciiString(TestCase):
+    def test_printable(self):
+        self.assertEqual(escape_ascii_string(b"hello, world"), "hello, world")
+        self.assertEqual(escape_ascii_string(bytearray(b"foo")), "foo")
+        self.assertEqual(escape_ascii_string(b""), "")
+
+    def test_not_bytes(self):
+        self.assertEqual(escape_ascii_string([104, 105, 0]), r"hi\0")
+
+    def test_nonprintable(self):
+        self.assertEqual(escape_ascii_string(b"a\tb\x7f\xff"), r"a\tb\x7f\xff")
+
+    def test_quotes_and_backslash(self):
+        self.assertEqual(escape_ascii_string(b"'\"\\"), "'\"\\")
+        self.assertEqual(
+            escape_ascii_string(b"'\"\\", escape_single_quote=True), "\\'\"\\"
+        )
+        self.assertEqual(
+            escape_ascii_string(b"'\"\\", escape_double_quote=True), "'\\\"\\"
+        )
+        self.assertEqual(
+            escape_ascii_string(b"'\"\\", escape_backslash=True), "'\"\\\\"
+        )
+
+    def test_double_quote(self):
+        self.assertEqual(double_quote_ascii_string(b"swapper/0"), '"swapper/0"')
+        self.assertEqual(double_quote_ascii_string(b'a"b\\c'), r'"a\"b\\c"')
+        self.assertEqual(double_quote_ascii_string(b"a\nb"), r'"a\nb"')
+
+
 class TestNumberInBinaryUnits(TestCase):
     def test_zero(self):
         self.assertEqual(number_in_binary_units(0), "0")
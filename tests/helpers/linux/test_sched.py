@@ -0,0 +1,133 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+import struct
+
+from drgn import Object, TypeMember
+from drgn.helpers.linux.sched import rq_for_each_rt_task
+from tests import MockMemorySegment, TestCase, mock_program
+
+# Stand-in for MAX_RT_PRIO to keep the mock runqueues small.
+NR_PRIOS = 4
+
+BASE = 0xFFFF0000
+RQ = BASE
+TASK1 = BASE + 0x100
+TASK2 = BASE + 0x200
+GROUP_SE = BASE + 0x300
+GROUP_RT_RQ = BASE + 0x400
+
+# Offset of rt in struct task_struct and of my_q in struct sched_rt_entity.
+TASK_RT_OFFSET = 8
+MY_Q_OFFSET = 16
+
+
+def rt_runqueues_memory(queued, my_qs):
+    # queued maps the address of a struct rt_rq to a {prio: struct
+    # sched_rt_entity address} dictionary (at most one entity per priority).
+    # my_qs maps the address of a group's struct sched_rt_entity to its struct
+    # rt_rq.
+    buf = bytearray(0x500)
+
+    def put(address, fmt, *values):
+        struct.pack_into("<" + fmt, buf, address - BASE, *values)
+
+    for rt_rq, entities in queued.items():
+        bitmap = 1 << NR_PRIOS  # Delimiter bit.
+        for prio in range(NR_PRIOS):
+            head = rt_rq + 8 + 16 * prio
+            entity = entities.get(prio)
+            if entity is None:
+                put(head, "QQ", head, head)
+            else:
+                bitmap |= 1 << prio
+                put(head, "QQ", entity, entity)
+                put(entity, "QQ", head, head)
+        put(rt_rq, "Q", bitmap)
+
+    for entity, my_q in my_qs.items():
+        put(entity + MY_Q_OFFSET, "Q", my_q)
+
+    put(TASK1, "i", 1)
+    put(TASK2, "i", 2)
+    return bytes(buf)
+
+
+def rt_mock_program(buf, *, rt_group_sched):
+    types = []
+    prog = mock_program(segments=[MockMemorySegment(buf, virt_addr=BASE)], types=types)
+
+    list_head = prog.struct_type(
+        "list_head",
+        16,
+        (
+            TypeMember(lambda: prog.pointer_type(list_head), "next", 0),
+            TypeMember(lambda: prog.pointer_type(list_head), "prev", 64),
+        ),
+    )
+    rt_prio_array = prog.struct_type(
+        "rt_prio_array",
+        8 + 16 * NR_PRIOS,
+        (
+            TypeMember(
+                prog.array_type(prog.int_type("unsigned long", 8, False), 1),
+                "bitmap",
+            ),
+            TypeMember(prog.array_type(list_head, NR_PRIOS), "queue", 64),
+        ),
+    )
+    rt_rq = prog.struct_type(
+        "rt_rq", rt_prio_array.size, (TypeMember(rt_prio_array, "active"),)
+    )
+    sched_rt_entity_members = [TypeMember(list_head, "run_list")]
+    if rt_group_sched:
+        sched_rt_entity_members.append(
+            TypeMember(prog.pointer_type(rt_rq), "my_q", 8 * MY_Q_OFFSET)
+        )
+    sched_rt_entity = prog.struct_type("sched_rt_entity", 24, sched_rt_entity_members)
+    types.extend(
+        (
+            list_head,
+            rt_prio_array,
+            rt_rq,
+            sched_rt_entity,
+            prog.struct_type(
+                "task_struct",
+                TASK_RT_OFFSET + sched_rt_entity.size,
+                (
+                    TypeMember(prog.int_type("int", 4, True), "pid"),
+                    TypeMember(sched_rt_entity, "rt", 8 * TASK_RT_OFFSET),
+                ),
+            ),
+            prog.struct_type("rq", rt_rq.size, (TypeMember(rt_rq, "rt"),)),
+        )
+    )
+    return prog
+
+
+class TestRqForEachRtTask(TestCase):
+    def test_tasks(self):
+        prog = rt_mock_program(
+            rt_runqueues_memory(
+                {RQ: {1: TASK1 + TASK_RT_OFFSET, 3: TASK2 + TASK_RT_OFFSET}}, {}
+            ),
+            rt_group_sched=False,
+        )
+        tasks = list(rq_for_each_rt_task(Object(prog, "struct rq *", RQ)))
+        self.assertEqual([task.value_() for task in tasks], [TASK1, TASK2])
+        self.assertEqual([task.pid.value_() for task in tasks], [1, 2])
+
+    def test_task_group(self):
+        prog = rt_mock_program(
+            rt_runqueues_memory(
+                {
+                    RQ: {1: TASK1 + TASK_RT_OFFSET, 2: GROUP_SE},
+                    GROUP_RT_RQ: {0: TASK2 + TASK_RT_OFFSET},
+                },
+                {GROUP_SE: GROUP_RT_RQ},
+            ),
+            rt_group_sched=True,
+        )
+        tasks = list(rq_for_each_rt_task(Object(prog, "struct rq *", RQ)))
+        self.assertEqual([task.value_() for task in tasks], [TASK1, TASK2])
+        self.assertEqual([task.pid.value_() for task in tasks], [1, 2])
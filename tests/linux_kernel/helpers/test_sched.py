@@ -15,6 +15,7 @@ from drgn.helpers.linux.cgroup import cgroup_get_from_path
 from drgn.helpers.linux.cpumask import for_each_possible_cpu
 from drgn.helpers.linux.pid import find_task
 from drgn.helpers.linux.sched import (
+    _for_each_cpu_rq,
     cfs_rq_for_each_entity,
     cpu_curr,
     cpu_rq,
@@ -121,6 +122,13 @@ class TestSched(LinuxKernelTestCase):
             else:
                 self.assertEqual(task.comm.string_(), f"swapper/{cpu}".encode())
 
+    def test_for_each_cpu_rq(self):
+        cpus = list(for_each_possible_cpu(self.prog))
+        self.assertEqual(
+            list(_for_each_cpu_rq(self.prog, cpus)),
+            [(cpu, cpu_rq(self.prog, cpu)) for cpu in cpus],
+        )
+
     def test_loadavg(self):
         values = loadavg(self.prog)
         self.assertEqual(len(values), 3)